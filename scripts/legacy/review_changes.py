@@ -5,6 +5,7 @@ import hashlib
 import json
 import pathlib
 import sys
+import unicodedata
 from datetime import datetime, timezone
 
 APPROVED = "approved"
@@ -15,15 +16,7 @@ def normalize_value(value: str) -> str:
     if value is None:
         return ""
     # Normalize whitespace and Unicode NFC
-    s = str(value).strip()
-    s = " ".join(s.split())
-    try:
-        import unicodedata
-
-        s = unicodedata.normalize("NFC", s)
-    except Exception:
-        pass
-    return s
+    return unicodedata.normalize("NFC", " ".join(str(value).split()))
 
 
 def compute_event_id(record_id: str, field: str, old_value: str, new_value: str) -> str:
@@ -46,12 +39,20 @@ def load_csv(path: pathlib.Path):
 
 
 def write_csv(path: pathlib.Path, fieldnames, rows):
+    # Rows share one schema, so checking the first keeps DictWriter's
+    # failure on unexpected fields without a per-row check
+    if rows:
+        extra = rows[0].keys() - set(fieldnames)
+        if extra:
+            raise ValueError(
+                "dict contains fields not in fieldnames: "
+                + ", ".join(repr(k) for k in sorted(extra))
+            )
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for r in rows:
-            writer.writerow(r)
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows([r.get(c, "") for c in fieldnames] for r in rows)
 
 
 def main():
@@ -124,20 +125,18 @@ def main():
 
     reviewed = list(dedup.values())
 
-    # Default all to approved
-    for r in reviewed:
-        r["review_status"] = APPROVED
-
-    # Apply optional overrides
+    # Optional overrides keyed by event_id
+    status_by_id = {}
     if args.approvals_csv and args.approvals_csv.exists():
         with args.approvals_csv.open("r", newline="", encoding="utf-8-sig") as f:
             ar = csv.DictReader(f)
             status_by_id = {
                 row["event_id"].strip(): row["review_status"].strip() for row in ar
             }
-        for r in reviewed:
-            if r["event_id"] in status_by_id:
-                r["review_status"] = status_by_id[r["event_id"]]
+
+    # Default to approved unless overridden (single pass, one lookup per row)
+    for r in reviewed:
+        r["review_status"] = status_by_id.get(r["event_id"], APPROVED)
 
     # Reorder columns for output
     out_cols = [
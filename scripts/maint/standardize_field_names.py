@@ -13,7 +13,9 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import os
 import re
+import shutil
 from pathlib import Path
 
 import pandas as pd
@@ -136,6 +138,20 @@ def check_columns(csv_path: Path) -> None:
             print(f"  - {col}")
 
 
+def backup_file(src: Path, dst: Path) -> None:
+    """Snapshot src at dst, hardlinking when possible to avoid a full copy.
+
+    The hardlink is only safe because apply_changes replaces the original
+    via os.replace (new inode) rather than truncating it in place.
+    """
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Cross-device, unsupported filesystem, or no link permission
+        shutil.copy2(src, dst)
+
+
 def apply_changes(csv_path: Path) -> None:
     """Apply column name changes to the CSV file."""
     print(f"Reading: {csv_path}")
@@ -159,13 +175,13 @@ def apply_changes(csv_path: Path) -> None:
     # Backup original
     backup_path = csv_path.with_suffix(".csv.bak")
     print(f"Creating backup: {backup_path}")
-    import shutil
-
-    shutil.copy(csv_path, backup_path)
+    backup_file(csv_path, backup_path)
 
-    # Write updated file
+    # Write updated file to a new inode so a hardlinked backup stays intact
     print(f"Writing: {csv_path}")
-    df.to_csv(csv_path, index=False, encoding="utf-8-sig")
+    tmp_path = csv_path.with_suffix(".csv.tmp")
+    df.to_csv(tmp_path, index=False, encoding="utf-8-sig")
+    os.replace(tmp_path, csv_path)
 
     print("\nDone! Column names standardized to snake_case.")
     print(f"Backup saved to: {backup_path}")
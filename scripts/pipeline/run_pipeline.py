@@ -4,13 +4,11 @@
 from __future__ import annotations
 
 import argparse
+import json
 import os
 import sys
 from pathlib import Path
 
-from nycgo_pipeline.pipeline import orchestrate_pipeline
-from nycgo_pipeline.run_ids import generate_run_id
-
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -86,15 +84,21 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> int:
     args = parse_args()
-    run_id = args.run_id or generate_run_id(args.descriptor)
+
+    # Imported after argument parsing so --help and usage errors do not pay
+    # for loading pandas and the pipeline modules.
+    from nycgo_pipeline.pipeline import orchestrate_pipeline
+
+    if args.run_id:
+        run_id = args.run_id
+    else:
+        from nycgo_pipeline.run_ids import generate_run_id
+
+        run_id = generate_run_id(args.descriptor)
     operator = args.operator or args.changed_by
 
+    # orchestrate_pipeline creates run_dir and its inputs/outputs/review dirs
     run_dir = (args.run_dir or Path("data/audit/runs") / run_id).resolve()
-    run_dir.mkdir(parents=True, exist_ok=True)
-
-    (run_dir / "inputs").mkdir(parents=True, exist_ok=True)
-    (run_dir / "outputs").mkdir(parents=True, exist_ok=True)
-    (run_dir / "review").mkdir(parents=True, exist_ok=True)
 
     golden_output = args.output_golden or run_dir / "outputs" / "golden_pre-release.csv"
     published_output = (
@@ -120,8 +124,8 @@ def main() -> int:
     print(f"Run ID: {run_id}")
     print(f"Run summary written to {summary['outputs']['run_summary_json']}")
     print("Summary:")
-    for key, value in summary.items():
-        print(f"  {key}: {value}")
+    json.dump(summary, sys.stdout, indent=2, default=str)
+    sys.stdout.write("\n")
     return 0
 
 
@@ -11,17 +11,23 @@ import argparse
 import sys
 from pathlib import Path
 
-import pandas as pd
-
+from nycgo_pipeline import crosswalk as crosswalk_utils
 from nycgo_pipeline.crosswalk import (
     DEFAULT_SOURCE_CONFIG,
     SourceConfig,
     build_crosswalk,
+    find_record_id_column,
+    read_golden_csv,
 )
 
 
 def generate_crosswalk(
-    input_path: Path, output_path: Path, config: dict[str, SourceConfig] | None = None
+    input_path: Path,
+    output_path: Path,
+    config: dict[str, SourceConfig] | None = None,
+    chunksize: int | None = None,
+    output_format: str = "csv",
+    dedup: bool = False,
 ):
     """
     Reads the golden dataset, extracts source names, and creates a crosswalk file.
@@ -29,18 +35,36 @@ def generate_crosswalk(
     Args:
         input_path (Path): Path to the input golden dataset CSV.
         output_path (Path): Path to save the output crosswalk CSV.
+        chunksize (int, optional): Stream the input in batches of this many rows.
+        output_format (str): "csv" (default) or "parquet". Parquet output is
+            zstd-compressed, written next to ``output_path`` with a .parquet
+            suffix, and requires pyarrow.
+        dedup (bool): Drop repeated (record_id, source_system, source_name) rows.
     """
+    if chunksize is not None:
+        print(f"Streaming golden dataset from: {input_path} ({chunksize} rows/batch)")
+        try:
+            crosswalk_utils.generate_crosswalk(
+                input_path, output_path, sources=config, chunksize=chunksize
+            )
+        except FileNotFoundError:
+            print(f"❌ Error: Input file not found at '{input_path}'", file=sys.stderr)
+            sys.exit(1)
+        except ValueError as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(f"✅ Successfully saved crosswalk to: {output_path}")
+        return
+
     print(f"Reading golden dataset from: {input_path}")
     try:
-        df = pd.read_csv(input_path, dtype=str)
+        df = read_golden_csv(input_path, sources=config)
     except FileNotFoundError:
         print(f"❌ Error: Input file not found at '{input_path}'", file=sys.stderr)
         sys.exit(1)
 
-    # Identify the RecordID column (case-insensitive)
-    try:
-        next(col for col in df.columns if col.lower() == "recordid")
-    except StopIteration:
+    # Identify the record id column (record_id or RecordID, case-insensitive)
+    if find_record_id_column(df.columns) is None:
         print(
             "❌ Error: Could not find a 'RecordID' column in the input file.",
             file=sys.stderr,
@@ -50,6 +74,7 @@ def generate_crosswalk(
     crosswalk = build_crosswalk(
         df,
         sources=config,
+        dedup=dedup,
     )
 
     if crosswalk.empty:
@@ -64,13 +89,31 @@ def generate_crosswalk(
     # Save the output file
     try:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        crosswalk.to_csv(output_path, index=False, encoding="utf-8-sig")
+        if output_format == "parquet":
+            output_path = output_path.with_suffix(".parquet")
+            crosswalk.to_parquet(output_path, index=False, compression="zstd")
+        else:
+            crosswalk.to_csv(output_path, index=False, encoding="utf-8-sig")
         print(f"✅ Successfully saved crosswalk to: {output_path}")
+    except ImportError:
+        print(
+            "❌ Error: Parquet output requires pyarrow (pip install pyarrow).",
+            file=sys.stderr,
+        )
+        sys.exit(1)
     except Exception as e:
         print(f"❌ Error saving output file to '{output_path}': {e}", file=sys.stderr)
         sys.exit(1)
 
 
+def positive_int(value: str) -> int:
+    """argparse type for options that must be a positive integer."""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
+
+
 def main():
     """Main function to handle command-line arguments and execute the script."""
     parser = argparse.ArgumentParser(
@@ -91,9 +134,45 @@ def main():
         required=True,
         help="Path to save the output crosswalk CSV file.",
     )
+    parser.add_argument(
+        "--chunksize",
+        type=positive_int,
+        help=(
+            "Optional: stream the input in batches of this many rows to bound\n"
+            "memory (output rows are grouped by batch)."
+        ),
+    )
+    parser.add_argument(
+        "--format",
+        choices=["csv", "parquet"],
+        default="csv",
+        help=(
+            "Output format (default: csv). Parquet is zstd-compressed, written\n"
+            "with a .parquet suffix, and requires pyarrow."
+        ),
+    )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help=(
+            "Drop repeated (record_id, source_system, source_name) rows, e.g.\n"
+            "from duplicated golden records."
+        ),
+    )
     args = parser.parse_args()
-
-    generate_crosswalk(args.input_csv, args.output_csv, DEFAULT_SOURCE_CONFIG)
+    if args.format == "parquet" and args.chunksize is not None:
+        parser.error("--chunksize streams CSV output and cannot be used with parquet")
+    if args.dedup and args.chunksize is not None:
+        parser.error("--dedup needs the whole dataset; drop --chunksize")
+
+    generate_crosswalk(
+        args.input_csv,
+        args.output_csv,
+        DEFAULT_SOURCE_CONFIG,
+        args.chunksize,
+        output_format=args.format,
+        dedup=args.dedup,
+    )
 
 
 if __name__ == "__main__":
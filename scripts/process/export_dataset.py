@@ -14,22 +14,29 @@ which is the single source of truth. The vectorized implementation below uses
 the same logic but optimized for pandas operations. Exemption lists are imported
 from the rules module to ensure consistency.
 """
+
 import argparse
 import csv
 import pathlib
 import re
+import shutil
 import sys
 from datetime import datetime, timezone
+from functools import cache
 
 import pandas as pd
+from pandas.api.types import is_bool_dtype
 
-# Import exemption lists and eligibility function from the single source of truth
+# Import exemption lists and overrides from the single source of truth
 from nycgo_pipeline.directory_rules import (
-    ADVISORY_EXEMPTIONS,
+    ADVISORY_EXEMPTION_SET,
     MANUAL_OVERRIDE_FALSE,
+    MANUAL_OVERRIDE_FALSE_SET,
     MANUAL_OVERRIDE_TRUE,
-    NONPROFIT_EXEMPTIONS,
-    evaluate_eligibility,
+    MANUAL_OVERRIDE_TRUE_SET,
+    NONPROFIT_EXEMPTION_SET,
+    PENSION_FUND_ALLOWLIST_SET,
+    PUBLISHED_EXPORT_EXCEPTION_IDS,
 )
 
 # =============================================================================
@@ -119,19 +126,54 @@ def reorder_columns(df: pd.DataFrame, column_order: list[str]) -> pd.DataFrame:
     - Columns in column_order appear first, in that order
     - Any extra columns not in column_order appear at the end (alphabetically)
     - Missing columns from column_order are skipped
+
+    A frame whose columns are already in that order is returned as is, so
+    callers should treat the result as read-only.
     """
     # Get columns that exist in both df and column_order, preserving order
     ordered_cols = [col for col in column_order if col in df.columns]
     # Get any extra columns not in the order (e.g., new Phase II fields)
-    extra_cols = sorted([col for col in df.columns if col not in column_order])
-    return df[ordered_cols + extra_cols]
+    known = set(column_order)
+    extra_cols = sorted(col for col in df.columns if col not in known)
+    new_order = ordered_cols + extra_cols
+    if new_order == list(df.columns):
+        return df
+    return df[new_order]
 
 
+@cache
 def to_snake_case(name: str) -> str:
-    """Converts a PascalCase or CamelCase string to snake_case."""
-    s1 = re.sub(r"(?<=[a-z0-9])([A-Z])", r"_\1", name)
-    s2 = re.sub(r"(?<=[A-Z])([A-Z][a-z])", r"_\1", s1)
-    return s2.lower()
+    """Converts a PascalCase or CamelCase string to snake_case.
+
+    An underscore goes before an uppercase letter that follows a lowercase
+    letter or digit, or that starts a new word after another uppercase letter
+    (``HTTPServer`` -> ``http_server``). Headers repeat on every export, so
+    results are cached.
+    """
+    n = len(name)
+    chars = []
+    prev = ""
+    for i, ch in enumerate(name):
+        if "A" <= ch <= "Z" and (
+            "a" <= prev <= "z"
+            or "0" <= prev <= "9"
+            or ("A" <= prev <= "Z" and i + 1 < n and "a" <= name[i + 1] <= "z")
+        ):
+            chars.append("_")
+        chars.append(ch)
+        prev = ch
+    return "".join(chars).lower()
+
+
+CSV_WRITE_BUFFER = 1 << 20
+
+
+def write_csv(df: pd.DataFrame, path: pathlib.Path) -> None:
+    """Write ``df`` as UTF-8-with-BOM CSV through a 1 MiB write buffer."""
+    with open(
+        path, "w", encoding="utf-8-sig", newline="", buffering=CSV_WRITE_BUFFER
+    ) as f:
+        df.to_csv(f, index=False)
 
 
 def write_proposed_changes(run_dir, changes, run_id, operator):
@@ -166,38 +208,131 @@ def write_proposed_changes(run_dir, changes, run_id, operator):
 
     # Append or create
     file_exists = proposed_path.exists() and proposed_path.stat().st_size > 0
-    with proposed_path.open("a", newline="", encoding="utf-8-sig") as f:
+    with proposed_path.open(
+        "a", newline="", encoding="utf-8-sig", buffering=CSV_WRITE_BUFFER
+    ) as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         if not file_exists:
             writer.writeheader()
 
-        for change in changes:
-            writer.writerow(
-                {
-                    "timestamp_utc": timestamp,
-                    "run_id": run_id or "",
-                    "record_id": change["record_id"],
-                    "record_name": change.get("record_name", ""),
-                    "field": change["field"],
-                    "old_value": change.get("old_value", ""),
-                    "new_value": change["new_value"],
-                    "reason": change.get("reason", "directory_logic_v1"),
-                    "evidence_url": "",
-                    "source_ref": change.get(
-                        "source_ref", "export_dataset.py::add_nycgov_directory_column"
-                    ),
-                    "operator": operator,
-                    "notes": change.get("notes", ""),
-                }
-            )
+        # Fields shared by every row are built once
+        base = {
+            "timestamp_utc": timestamp,
+            "run_id": run_id or "",
+            "evidence_url": "",
+            "operator": operator,
+        }
+        writer.writerows(
+            {
+                **base,
+                "record_id": change["record_id"],
+                "record_name": change.get("record_name", ""),
+                "field": change["field"],
+                "old_value": change.get("old_value", ""),
+                "new_value": change["new_value"],
+                "reason": change.get("reason", "directory_logic_v1"),
+                "source_ref": change.get(
+                    "source_ref", "export_dataset.py::add_nycgov_directory_column"
+                ),
+                "notes": change.get("notes", ""),
+            }
+            for change in changes
+        )
 
     print(f"✅ Wrote {len(changes)} directory field changes to {proposed_path}")
 
 
+# Organization types that directory_rules.py includes unconditionally, and
+# those included only when in the Org Chart
+ALWAYS_INCLUDED_TYPES = frozenset(
+    {"Mayoral Agency", "Mayoral Office", "Elected Office", "State Government Agency"}
+)
+ORG_CHART_ONLY_TYPES = frozenset(
+    {"Division", "Public Benefit or Development Organization"}
+)
+# add_nycgov_directory_column also includes every Pension Fund, where
+# directory_rules.py applies an allowlist
+DIRECTORY_ALWAYS_TYPES = ALWAYS_INCLUDED_TYPES | {"Pension Fund"}
+
+
+def column_or(df: pd.DataFrame, name: str, default) -> pd.Series:
+    """Return ``df[name]``, or ``default`` broadcast over ``df.index`` if absent.
+
+    Unlike ``df.get(name, pd.Series(...))`` the fallback is only built when
+    the column is missing, and it always aligns with the frame's index.
+    """
+    if name in df.columns:
+        return df[name]
+    return pd.Series(default, index=df.index)
+
+
+def has_text(values: pd.Series) -> pd.Series:
+    """Return True where a value is present and not blank after stripping."""
+    return values.fillna("").astype(str).str.strip().ne("")
+
+
+TRUE_TOKENS = frozenset({"true", "1", "t", "yes"})
+
+
+def truthy_mask(values: pd.Series, tokens=TRUE_TOKENS) -> pd.Series:
+    """Return True where ``str(value).lower()`` is one of ``tokens``.
+
+    Boolean columns are returned as-is. Otherwise only the column's distinct
+    strings are lowercased and checked, and the result is mapped back, instead
+    of lowercasing every cell. Missing values count as False.
+    """
+    if is_bool_dtype(values):
+        return values
+    text = values.fillna("").astype(str)
+    lookup = {value: value.lower() in tokens for value in text.unique()}
+    return text.map(lookup).astype(bool)
+
+
+BOOL_TOKENS = {
+    "true": "True",
+    "1": "True",
+    "t": "True",
+    "yes": "True",
+    "false": "False",
+    "0": "False",
+    "f": "False",
+    "no": "False",
+}
+
+
+def normalize_bool_series(values: pd.Series) -> pd.Series:
+    """Normalize boolean representations to "True"/"False" ("" if unrecognized)."""
+    return (
+        values.fillna("")
+        .astype(str)
+        .str.strip()
+        .str.lower()
+        .map(BOOL_TOKENS)
+        .fillna("")
+    )
+
+
 ### START OF DIRECTORY FIELD LOGIC (v2) ###
-def add_nycgov_directory_column(
-    df, df_before_snake_case=None, df_previous_export=None, run_id=None
-):  # noqa: C901
+# Columns add_nycgov_directory_column reads from a previous export, in
+# either header style; the rest of the file is skipped at parse time
+PREVIOUS_EXPORT_COLUMNS = frozenset(
+    {
+        "RecordID",
+        "record_id",
+        "ListedInNycGovAgencyDirectory",
+        "listed_in_nyc_gov_agency_directory",
+    }
+)
+
+
+def read_previous_export(path: pathlib.Path) -> pd.DataFrame:
+    """Read the columns needed for directory change tracking from an export."""
+    return pd.read_csv(
+        path, dtype=str, usecols=lambda col: col in PREVIOUS_EXPORT_COLUMNS
+    )
+
+
+def add_nycgov_directory_column(df, df_previous_export=None, run_id=None):  # noqa: C901
     """Applies business logic (v2) to determine if a record should be on the NYC.gov
     Agency Directory.
 
@@ -222,7 +357,6 @@ def add_nycgov_directory_column(
 
     Args:
         df: Current dataframe (after snake_case conversion)
-        df_before_snake_case: Original dataframe before snake_case conversion (deprecated)
         df_previous_export: Previous export file to compare against for changelog
         run_id: Run identifier for changelog tracking
 
@@ -233,8 +367,11 @@ def add_nycgov_directory_column(
         "Applying final, corrected logic for 'listed_in_nyc_gov_agency_directory' "
         "column..."
     )
-    # Reset index to ensure masks align correctly
-    df_processed = df.copy().reset_index(drop=True)
+    # Fresh RangeIndex so masks align correctly. A shallow copy is enough: the
+    # only write below replaces a whole column, which never reaches the
+    # caller's frame, so the other columns need not be duplicated
+    df_processed = df.copy(deep=False)
+    df_processed.index = pd.RangeIndex(len(df_processed))
 
     # Capture old values if tracking is enabled
     old_values = {}
@@ -258,8 +395,13 @@ def add_nycgov_directory_column(
                     break
 
             if record_id_col:
-                for idx, row in df_previous_export.iterrows():
-                    old_values[row[record_id_col]] = str(row.get(old_col, ""))
+                old_values = dict(
+                    zip(
+                        df_previous_export[record_id_col],
+                        df_previous_export[old_col].astype(str),
+                        strict=False,
+                    )
+                )
             print(
                 f"  - Loaded {len(old_values)} old values for change tracking from previous export"
             )
@@ -272,12 +414,13 @@ def add_nycgov_directory_column(
 
     # --- Exemption Lists from single source of truth (directory_rules.py) ---
     # These are imported at module level from nycgo_pipeline.directory_rules
-    nonprofit_exemptions = NONPROFIT_EXEMPTIONS
-    advisory_exemptions = ADVISORY_EXEMPTIONS
+    # (frozensets, so isin() and per-record membership tests are O(1))
+    nonprofit_exemptions = NONPROFIT_EXEMPTION_SET
+    advisory_exemptions = ADVISORY_EXEMPTION_SET
 
     # Manual overrides from single source of truth (directory_rules.py)
-    manual_override_true_record_ids = MANUAL_OVERRIDE_TRUE
-    manual_override_false_record_ids = MANUAL_OVERRIDE_FALSE
+    manual_override_true_record_ids = MANUAL_OVERRIDE_TRUE_SET
+    manual_override_false_record_ids = MANUAL_OVERRIDE_FALSE_SET
 
     # Create manual override masks
     manual_override_true_mask = df_processed["record_id"].isin(
@@ -287,18 +430,22 @@ def add_nycgov_directory_column(
         manual_override_false_record_ids
     )
 
+    # Names of overridden records (first row per id) for the listing below;
+    # built from the few matching rows instead of scanning per override id
+    overridden = df_processed.loc[
+        manual_override_true_mask | manual_override_false_mask, ["record_id", "name"]
+    ].drop_duplicates("record_id")
+    name_by_id = dict(zip(overridden["record_id"], overridden["name"], strict=False))
+
     if manual_override_true_mask.sum() > 0:
         print(
             "Manual override TRUE: "
             f"{manual_override_true_mask.sum()} "
             "records will be forced to TRUE"
         )
-        for record_id in manual_override_true_record_ids:
-            if record_id in df_processed["record_id"].values:
-                record_name = df_processed[df_processed["record_id"] == record_id][
-                    "name"
-                ].iloc[0]
-                print(f"  - {record_id}: {record_name}")
+        for record_id in MANUAL_OVERRIDE_TRUE:
+            if record_id in name_by_id:
+                print(f"  - {record_id}: {name_by_id[record_id]}")
 
     if manual_override_false_mask.sum() > 0:
         print(
@@ -306,12 +453,9 @@ def add_nycgov_directory_column(
             f"{manual_override_false_mask.sum()} "
             "records will be forced to FALSE"
         )
-        for record_id in manual_override_false_record_ids:
-            if record_id in df_processed["record_id"].values:
-                record_name = df_processed[df_processed["record_id"] == record_id][
-                    "name"
-                ].iloc[0]
-                print(f"  - {record_id}: {record_name}")
+        for record_id in MANUAL_OVERRIDE_FALSE:
+            if record_id in name_by_id:
+                print(f"  - {record_id}: {name_by_id[record_id]}")
 
     # --- BLANKET GATEKEEPER RULES (must pass ALL of these) ---
     # 1. Must be Active
@@ -322,27 +466,22 @@ def add_nycgov_directory_column(
 
     # 2. URL must NOT contain state "ny.gov" (but city "nyc.gov" is OK)
     # Check for state URLs like ".ny.gov" but exclude city URLs ".nyc.gov"
-    has_url = df_processed["url"].notna() & (df_processed["url"].str.strip() != "")
+    url_stripped = df_processed["url"].fillna("").astype(str).str.strip()
+    has_url = url_stripped.ne("")
+    # Lowercase once; the URL checks below are fixed substrings, so plain
+    # (non-regex) matching against this copy replaces case-insensitive regexes
+    url_lower = url_stripped.str.lower()
     # Match ".ny.gov" but not ".nyc.gov" - check for "ny.gov" but not preceded by "c"
     url_contains_state_nygov = has_url & (
-        df_processed["url"].str.contains(r"\.ny\.gov", case=False, na=False, regex=True)
-        & ~df_processed["url"].str.contains(
-            r"\.nyc\.gov", case=False, na=False, regex=True
-        )
+        url_lower.str.contains(".ny.gov", regex=False)
+        & ~url_lower.str.contains(".nyc.gov", regex=False)
     )
     url_ok = ~url_contains_state_nygov
 
     # 3. Must have at least ONE contact field
-    has_url_value = df_processed["url"].notna() & (
-        df_processed["url"].str.strip() != ""
-    )
-    has_officer_name = df_processed["principal_officer_full_name"].notna() & (
-        df_processed["principal_officer_full_name"].str.strip() != ""
-    )
-    has_officer_contact_url = df_processed["principal_officer_contact_url"].notna() & (
-        df_processed["principal_officer_contact_url"].str.strip() != ""
-    )
-    has_contact_info = has_url_value | has_officer_name | has_officer_contact_url
+    has_officer_name = has_text(df_processed["principal_officer_full_name"])
+    has_officer_contact_url = has_text(df_processed["principal_officer_contact_url"])
+    has_contact_info = has_url | has_officer_name | has_officer_contact_url
 
     # Blanket rules: Active AND no state ny.gov AND has contact info
     passes_blanket_rules = is_active & url_ok & has_contact_info
@@ -356,80 +495,59 @@ def add_nycgov_directory_column(
     print(f"  - Records passing ALL blanket rules: {passes_blanket_rules.sum()}")
 
     # --- ORGANIZATION TYPE SPECIFIC RULES ---
-    org_type = df_processed["organization_type"].fillna("").str.strip()
-    in_org_chart = (
-        df_processed.get("in_org_chart", pd.Series([False] * len(df_processed)))
-        .fillna("")
-        .astype(str)
-        .str.lower()
-        .isin(["true", "1", "t", "yes"])
+    # Categorical so the nine type comparisons below compare small integer
+    # codes rather than every string
+    org_type = (
+        df_processed["organization_type"].fillna("").str.strip().astype("category")
     )
+    in_org_chart = truthy_mask(column_or(df_processed, "in_org_chart", False))
     org_name = df_processed["name"].fillna("").str.strip()
 
     # Check for nyc.gov URLs with index.page (for Advisory orgs)
     has_main_nyc_gov = has_url & (
-        df_processed["url"].str.contains(r"nyc\.gov", case=False, na=False, regex=True)
-        & df_processed["url"].str.contains(
-            r"index\.page", case=False, na=False, regex=True
-        )
+        url_lower.str.contains("nyc.gov", regex=False)
+        & url_lower.str.contains("index.page", regex=False)
     )
 
-    # Build type-specific inclusion masks
-    type_mask = pd.Series([False] * len(df_processed))
-
-    # Mayoral Agency: all included
-    type_mask |= org_type == "Mayoral Agency"
-
-    # Mayoral Office: all included
-    type_mask |= org_type == "Mayoral Office"
+    # Types included unconditionally share one isin() pass; their debug
+    # counts come from a single value_counts() over the category codes
+    type_counts = org_type.value_counts()
+    always_included = org_type.isin(DIRECTORY_ALWAYS_TYPES)
 
+    # Conditional types (each mask is reused by the debug output)
     # Division: only if in Org Chart
-    type_mask |= (org_type == "Division") & in_org_chart
-
-    # Elected Office: all included
-    type_mask |= org_type == "Elected Office"
+    division = org_type.eq("Division") & in_org_chart
 
     # Nonprofit Organization: only if in Org Chart OR in exemption list
-    type_mask |= (org_type == "Nonprofit Organization") & (
+    nonprofit = org_type.eq("Nonprofit Organization") & (
         in_org_chart | org_name.isin(nonprofit_exemptions)
     )
 
-    # Pension Fund: all included
-    type_mask |= org_type == "Pension Fund"
-
-    # State Government Agency: all included
-    type_mask |= org_type == "State Government Agency"
-
     # Public Benefit or Development Organization: only if in Org Chart
-    type_mask |= (
-        org_type == "Public Benefit or Development Organization"
-    ) & in_org_chart
+    public_benefit = (
+        org_type.eq("Public Benefit or Development Organization") & in_org_chart
+    )
 
     # Advisory or Regulatory Organization: if in org chart OR has main nyc.gov url OR in exemption list
-    type_mask |= (org_type == "Advisory or Regulatory Organization") & (
+    advisory = org_type.eq("Advisory or Regulatory Organization") & (
         in_org_chart | has_main_nyc_gov | org_name.isin(advisory_exemptions)
     )
 
+    type_mask = always_included | division | nonprofit | public_benefit | advisory
+
     print("\nDebug - Organization type specific rules:")
-    print(f"  - Mayoral Agency: {(org_type == 'Mayoral Agency').sum()} total")
-    print(f"  - Mayoral Office: {(org_type == 'Mayoral Office').sum()} total")
-    print(
-        f"  - Division (in Org Chart): {((org_type == 'Division') & in_org_chart).sum()} included"
-    )
-    print(f"  - Elected Office: {(org_type == 'Elected Office').sum()} total")
-    print(
-        f"  - Nonprofit (in Org Chart or exemption): {((org_type == 'Nonprofit Organization') & (in_org_chart | org_name.isin(nonprofit_exemptions))).sum()} included"
-    )
-    print(f"  - Pension Fund: {(org_type == 'Pension Fund').sum()} total")
-    print(
-        f"  - State Government Agency: {(org_type == 'State Government Agency').sum()} total"
-    )
-    print(
-        f"  - Public Benefit/Dev (in Org Chart): {((org_type == 'Public Benefit or Development Organization') & in_org_chart).sum()} included"
-    )
+    print(f"  - Mayoral Agency: {type_counts.get('Mayoral Agency', 0)} total")
+    print(f"  - Mayoral Office: {type_counts.get('Mayoral Office', 0)} total")
+    print(f"  - Division (in Org Chart): {division.sum()} included")
+    print(f"  - Elected Office: {type_counts.get('Elected Office', 0)} total")
+    print(f"  - Nonprofit (in Org Chart or exemption): {nonprofit.sum()} included")
+    print(f"  - Pension Fund: {type_counts.get('Pension Fund', 0)} total")
     print(
-        f"  - Advisory/Regulatory: {((org_type == 'Advisory or Regulatory Organization') & (in_org_chart | has_main_nyc_gov | org_name.isin(advisory_exemptions))).sum()} included"
+        "  - State Government Agency: "
+        f"{type_counts.get('State Government Agency', 0)} total"
     )
+    print(f"  - Public Benefit/Dev (in Org Chart): {public_benefit.sum()} included")
+    print(f"  - Advisory/Regulatory: {advisory.sum()} included")
 
     # --- FINAL COMBINATION ---
     # Must pass blanket rules AND type-specific rules
@@ -486,63 +604,43 @@ def add_nycgov_directory_column(
     changes = []
     if run_id:
         print("\nTracking changes to listed_in_nyc_gov_agency_directory...")
-        for idx, row in df_processed.iterrows():
-            record_id = row["record_id"]
-            new_val = str(row["listed_in_nyc_gov_agency_directory"])
-            old_val = old_values.get(record_id, "")
-
-            # Normalize boolean representations (True/False/true/false/1/0 -> "True"/"False")
-            def normalize_bool(val):
-                if not val or val.strip() == "":
-                    return ""
-                val_lower = str(val).strip().lower()
-                if val_lower in ["true", "1", "t", "yes"]:
-                    return "True"
-                elif val_lower in ["false", "0", "f", "no"]:
-                    return "False"
-                return ""
-
-            new_normalized = normalize_bool(new_val)
-            old_normalized = normalize_bool(old_val)
-
-            # Track if value changed
-            if new_normalized != old_normalized:
-                # Determine context for the change
-                is_manual_true = record_id in manual_override_true_record_ids
-                is_manual_false = record_id in manual_override_false_record_ids
-                row_data = df_processed[df_processed["record_id"] == record_id].iloc[0]
-                org_type_val = row_data.get("organization_type", "")
-                org_name_val = row_data.get("name", "")
-
-                # Build detailed notes
-                notes = ""
-                if is_manual_true:
-                    notes = "Manual override: forced to TRUE"
-                elif is_manual_false:
-                    notes = "Manual override: forced to FALSE"
-                else:
-                    # Describe why the change occurred based on type and exemptions
-                    if org_name_val in nonprofit_exemptions:
-                        notes = f"Type-based inclusion: {org_type_val} (Nonprofit exemption)"
-                    elif org_name_val in advisory_exemptions:
-                        notes = (
-                            f"Type-based inclusion: {org_type_val} (Advisory exemption)"
-                        )
-                    else:
-                        notes = f"Type-based inclusion: {org_type_val}"
-
-                changes.append(
-                    {
-                        "record_id": record_id,
-                        "record_name": org_name_val,
-                        "field": "listed_in_nyc_gov_agency_directory",
-                        "old_value": old_normalized,
-                        "new_value": new_normalized,
-                        "reason": "directory_logic_v2",
-                        "source_ref": "export_dataset.py::add_nycgov_directory_column",
-                        "notes": notes,
-                    }
-                )
+        new_normalized = final_mask.map({True: "True", False: "False"})
+        old_normalized = normalize_bool_series(
+            df_processed["record_id"].map(old_values)
+        )
+        changed = new_normalized.ne(old_normalized)
+
+        # Describe why each change occurred; later masks take precedence
+        tracked = df_processed.loc[changed]
+        org_name_val = tracked["name"]
+        type_note = "Type-based inclusion: " + tracked["organization_type"].astype(str)
+        notes = type_note.mask(
+            org_name_val.isin(advisory_exemptions),
+            type_note + " (Advisory exemption)",
+        )
+        notes = notes.mask(
+            org_name_val.isin(nonprofit_exemptions),
+            type_note + " (Nonprofit exemption)",
+        )
+        notes = notes.mask(
+            manual_override_false_mask[changed], "Manual override: forced to FALSE"
+        )
+        notes = notes.mask(
+            manual_override_true_mask[changed], "Manual override: forced to TRUE"
+        )
+
+        changes = pd.DataFrame(
+            {
+                "record_id": tracked["record_id"],
+                "record_name": org_name_val,
+                "field": "listed_in_nyc_gov_agency_directory",
+                "old_value": old_normalized[changed],
+                "new_value": new_normalized[changed],
+                "reason": "directory_logic_v2",
+                "source_ref": "export_dataset.py::add_nycgov_directory_column",
+                "notes": notes,
+            }
+        ).to_dict("records")
 
         print(f"  - Detected {len(changes)} changes to directory field")
         return df_processed, changes
@@ -553,6 +651,62 @@ def add_nycgov_directory_column(
 ### END OF DIRECTORY FIELD LOGIC (v2) ###
 
 
+def directory_eligibility_mask(df: pd.DataFrame) -> pd.Series:
+    """Return ``evaluate_eligibility(row).eligible`` for every row, vectorized.
+
+    Mirrors the rules in directory_rules.py column-wise, including their
+    ``str(value)`` coercion (a missing column reads as "", NaN as "nan") and
+    manual overrides (TRUE wins over FALSE). Keep in step with that module;
+    tests compare the two on every record of the golden dataset.
+    """
+
+    def text(col: str) -> pd.Series:
+        return column_or(df, col, "").astype(str)
+
+    def raw(col: str) -> pd.Series:
+        return column_or(df, col, None)
+
+    url = text("url")
+    org_type = raw("organization_type")
+    name = raw("name")
+    record_id = raw("record_id")
+    in_org_chart = truthy_mask(text("in_org_chart").str.strip())
+
+    # Gatekeeper rules (all must pass)
+    is_active = text("operational_status").str.strip().str.lower().eq("active")
+    is_state_nygov = url.str.contains(
+        r"\.ny\.gov", flags=re.IGNORECASE, regex=True
+    ) & ~url.str.contains(r"\.nyc\.gov", flags=re.IGNORECASE, regex=True)
+    has_contact_info = (
+        url.str.strip().ne("")
+        | text("principal_officer_full_name").str.strip().ne("")
+        | text("principal_officer_contact_url").str.strip().ne("")
+    )
+    passes_gatekeepers = is_active & ~is_state_nygov & has_contact_info
+
+    # Type-specific rules (at least one must pass)
+    has_main_nyc_gov = url.str.contains(
+        r"nyc\.gov", flags=re.IGNORECASE, regex=True
+    ) & url.str.contains(r"index\.page", flags=re.IGNORECASE, regex=True)
+    passes_type_rule = (
+        org_type.isin(ALWAYS_INCLUDED_TYPES)
+        | (org_type.eq("Pension Fund") & name.isin(PENSION_FUND_ALLOWLIST_SET))
+        | (org_type.isin(ORG_CHART_ONLY_TYPES) & in_org_chart)
+        | (
+            org_type.eq("Nonprofit Organization")
+            & (in_org_chart | name.isin(NONPROFIT_EXEMPTION_SET))
+        )
+        | (
+            org_type.eq("Advisory or Regulatory Organization")
+            & (in_org_chart | has_main_nyc_gov | name.isin(ADVISORY_EXEMPTION_SET))
+        )
+    )
+
+    forced_true = record_id.isin(MANUAL_OVERRIDE_TRUE_SET)
+    forced_false = record_id.isin(MANUAL_OVERRIDE_FALSE_SET)
+    return forced_true | (~forced_false & passes_gatekeepers & passes_type_rule)
+
+
 def calculate_directory_eligibility_all(df: pd.DataFrame) -> pd.DataFrame:
     """
     Calculate directory eligibility for ALL records in the dataframe.
@@ -560,7 +714,8 @@ def calculate_directory_eligibility_all(df: pd.DataFrame) -> pd.DataFrame:
     This ensures the golden dataset has freshly calculated directory eligibility
     values, consistent with what the published export would calculate.
 
-    Uses evaluate_eligibility() from directory_rules.py (single source of truth).
+    Applies the directory_rules.py rules (single source of truth) column-wise
+    via directory_eligibility_mask().
 
     Args:
         df: DataFrame with organization records (expects snake_case column names)
@@ -572,13 +727,10 @@ def calculate_directory_eligibility_all(df: pd.DataFrame) -> pd.DataFrame:
 
     df = df.copy()
 
-    def calc_eligibility(row):
-        record = row.to_dict()
-        result = evaluate_eligibility(record)
-        # Return uppercase strings to match schema enum: "TRUE", "FALSE", ""
-        return "TRUE" if result.eligible else "FALSE"
-
-    df["listed_in_nyc_gov_agency_directory"] = df.apply(calc_eligibility, axis=1)
+    # Uppercase strings to match schema enum: "TRUE", "FALSE", ""
+    df["listed_in_nyc_gov_agency_directory"] = directory_eligibility_mask(df).map(
+        {True: "TRUE", False: "FALSE"}
+    )
 
     eligible_count = (df["listed_in_nyc_gov_agency_directory"] == "TRUE").sum()
     print(f"  - {eligible_count} of {len(df)} records are directory-eligible")
@@ -651,7 +803,7 @@ def main():
     df_previous_export = None
     if args.previous_export:
         try:
-            df_previous_export = pd.read_csv(args.previous_export, dtype=str)
+            df_previous_export = read_previous_export(args.previous_export)
             print(f"Loaded previous export from {args.previous_export} for comparison")
         except FileNotFoundError:
             print(
@@ -667,7 +819,7 @@ def main():
         args.output_golden.parent.mkdir(parents=True, exist_ok=True)
         # Apply canonical column ordering for golden dataset
         df_ordered = reorder_columns(df, GOLDEN_COLUMN_ORDER)
-        df_ordered.to_csv(args.output_golden, index=False, encoding="utf-8-sig")
+        write_csv(df_ordered, args.output_golden)
         print("✅ Golden dataset saved successfully.")
     except Exception as e:
         print(f"Error saving golden dataset: {e}")
@@ -675,49 +827,35 @@ def main():
 
     # --- Step 2: Process and save the Published Dataset ---
     print("\nProcessing data for public export...")
-    df_public = df.copy()
+    # The row filter and column selection below each build a new frame, so
+    # no defensive copy of the full golden dataset is needed
+    df_public = df
 
     # --- Filter for records to include in public output ---
     print("Applying filters for public export...")
     rows_before_filter = len(df_public)
 
-    # Published export exceptions: records that should always be included
-    # regardless of in_org_chart status
-    published_export_exceptions = [
-        "NYC_GOID_000354",  # Office of Collective Bargaining
-        "NYC_GOID_000476",  # MTA (Metropolitan Transportation Authority)
-        "NYC_GOID_100030",  # Office of Digital Assets and Blockchain
-    ]
-
-    in_org_chart = (
-        df_public.get("in_org_chart", pd.Series([False] * len(df_public)))
-        .astype(str)
-        .str.lower()
-        .map({"true": True})
-        .fillna(False)
+    in_org_chart = truthy_mask(
+        column_or(df_public, "in_org_chart", False), tokens={"true"}
     )
-    has_ops_name = df_public.get(
-        "name_ops", pd.Series([False] * len(df_public))
-    ).notna() & (
-        df_public.get("name_ops", pd.Series([""] * len(df_public))).str.strip() != ""
+    has_ops_name = has_text(column_or(df_public, "name_ops", ""))
+    # Published export exceptions (directory_rules.py) are always included
+    # regardless of in_org_chart status
+    is_export_exception = column_or(df_public, "record_id", "").isin(
+        PUBLISHED_EXPORT_EXCEPTION_IDS
     )
-    is_export_exception = df_public.get(
-        "record_id", pd.Series([""] * len(df_public))
-    ).isin(published_export_exceptions)
     # New requirement: only export records where operational_status is Active
     active_only = (
-        df_public.get("operational_status", pd.Series([""] * len(df_public)))
+        column_or(df_public, "operational_status", "")
         .astype(str)
         .str.strip()
         .str.lower()
-        == "active"
+        .eq("active")
     )
 
-    df_public = df_public[
-        (in_org_chart | has_ops_name | is_export_exception) & active_only
-    ].copy()
+    keep = (in_org_chart | has_ops_name | is_export_exception) & active_only
     print(
-        f"Kept {len(df_public)} rows out of {rows_before_filter} after applying combined filter."
+        f"Kept {keep.sum()} rows out of {rows_before_filter} after applying combined filter."
     )
 
     # --- Select and order columns for final output ---
@@ -737,29 +875,21 @@ def main():
         for c in PUBLISHED_COLUMN_ORDER
         if c in df_public.columns and c != "listed_in_nyc_gov_agency_directory"
     ]
-    df_selected = df_public[output_columns]
-
-    # Note: Golden dataset is now stored with snake_case headers, so no conversion needed
-    # Keep df_before_snake_case for backward compatibility with change tracking
-    df_before_snake_case = df_selected.copy()
+    # Filter rows and project the published columns in one step; the result
+    # is a new frame, so rewriting in_org_chart below never touches df
+    df_selected = df_public.loc[keep, output_columns]
 
     # --- Normalize in_org_chart: fill blanks as False and coerce to booleans ---
     if "in_org_chart" in df_selected.columns:
-        normalized = (
-            df_selected["in_org_chart"]
-            .astype(str)
-            .str.strip()
-            .str.lower()
-            .replace({"": "false"})
+        # Anything other than "true" (blank, "false", unexpected) becomes "False"
+        is_true = (
+            df_selected["in_org_chart"].astype(str).str.strip().str.lower().eq("true")
         )
-        df_selected["in_org_chart"] = normalized.map(
-            {"true": "True", "false": "False"}
-        ).fillna("False")
+        df_selected["in_org_chart"] = is_true.map({True: "True", False: "False"})
 
     # --- Add NYC.gov Directory column AFTER snake_case conversion ---
     result = add_nycgov_directory_column(
         df_selected,
-        df_before_snake_case=df_before_snake_case if args.run_dir else None,
         df_previous_export=df_previous_export,
         run_id=args.run_id,
     )
@@ -774,16 +904,21 @@ def main():
     # Save final published file
     try:
         args.output_published.parent.mkdir(parents=True, exist_ok=True)
-        df_selected.to_csv(args.output_published, index=False, encoding="utf-8-sig")
+        write_csv(df_selected, args.output_published)
         print(f"✅ Published dataset saved successfully to: {args.output_published}")
     except Exception as e:
         print(f"Error saving published dataset: {e}")
         sys.exit(1)
 
-    # Also write a copy of the full golden to data/published for convenience
+    # Also save the full golden to data/published for convenience. This copy
+    # keeps the input column order; when Step 1 did not reorder anything the
+    # file it wrote is identical, so copy it instead of encoding df again
     try:
         published_golden_path = args.output_published.parent / args.output_golden.name
-        df.to_csv(published_golden_path, index=False, encoding="utf-8-sig")
+        if not df_ordered.columns.equals(df.columns):
+            write_csv(df, published_golden_path)
+        elif published_golden_path.resolve() != args.output_golden.resolve():
+            shutil.copyfile(args.output_golden, published_golden_path)
         print(f"✅ Golden dataset also saved to: {published_golden_path}")
     except Exception as e:
         print(f"Warning: Failed to save golden to published folder: {e}")
@@ -821,95 +956,58 @@ def main_with_dataframe(
 
     Note: Expects DataFrame with snake_case column names (standardized format).
     """
-    df_input = df.copy()
-
     # Calculate directory eligibility for ALL records before saving golden.
     # (Sprint 7.4: "Calculate once, use everywhere")
-    df_input = calculate_directory_eligibility_all(df_input)
+    # This returns a new frame, so the caller's DataFrame is never modified.
+    df_input = calculate_directory_eligibility_all(df)
 
     df_previous_export = None
     if previous_export and previous_export.exists():
-        df_previous_export = pd.read_csv(previous_export, dtype=str)
+        df_previous_export = read_previous_export(previous_export)
 
     output_golden.parent.mkdir(parents=True, exist_ok=True)
     # Apply canonical column ordering for golden dataset
     df_golden_ordered = reorder_columns(df_input, GOLDEN_COLUMN_ORDER)
-    df_golden_ordered.to_csv(output_golden, index=False, encoding="utf-8-sig")
+    write_csv(df_golden_ordered, output_golden)
 
-    df_public = df_input.copy()
+    df_public = df_input
 
     # Apply the same published dataset filters used by the CLI entrypoint
-    # Published export exceptions: records that should always be included
-    # regardless of in_org_chart status
-    published_export_exceptions = [
-        "NYC_GOID_000354",  # Office of Collective Bargaining
-        "NYC_GOID_000476",  # MTA (Metropolitan Transportation Authority)
-        "NYC_GOID_100030",  # Office of Digital Assets and Blockchain
-    ]
-
     rows_before_filter = len(df_public)
-    in_org_chart = (
-        df_public.get("in_org_chart", pd.Series([False] * len(df_public)))
-        .astype(str)
-        .str.strip()
-        .str.lower()
-        .map({"true": True})
-        .fillna(False)
-    )
-    has_ops_name = (
-        df_public.get("name_ops", pd.Series(["" for _ in range(len(df_public))]))
-        .astype(str)
-        .str.strip()
-        .ne("")
-    )
-    is_export_exception = df_public.get(
-        "record_id", pd.Series([""] * len(df_public))
-    ).isin(published_export_exceptions)
-    active_only = (
-        df_public.get(
-            "operational_status", pd.Series(["" for _ in range(len(df_public))])
-        )
-        .astype(str)
-        .str.strip()
-        .str.lower()
-        == "active"
+
+    def normalized(name: str) -> pd.Series:
+        # One str/strip/lower pass per column; absent columns read as ""
+        return column_or(df_public, name, "").astype(str).str.strip().str.lower()
+
+    in_org_chart = normalized("in_org_chart").eq("true")
+    has_ops_name = normalized("name_ops").ne("")
+    # Published export exceptions (directory_rules.py) are always included
+    # regardless of in_org_chart status
+    is_export_exception = column_or(df_public, "record_id", "").isin(
+        PUBLISHED_EXPORT_EXCEPTION_IDS
     )
+    active_only = normalized("operational_status").eq("active")
 
-    # Check directory eligibility using the canonical rules
+    # Directory eligibility from the canonical rules, already computed for
+    # every record above; reuse it rather than re-evaluating the columns
     # This ensures orgs that qualify for NYC.gov Agency Directory are included
-    def check_directory_eligible(row):
-        record = row.to_dict()
-        result = evaluate_eligibility(record)
-        return result.eligible
-
-    is_directory_eligible = df_public.apply(check_directory_eligible, axis=1)
+    is_directory_eligible = df_public["listed_in_nyc_gov_agency_directory"].eq("TRUE")
 
     # Mayoral Offices should always be included in Open Data export
     # (even if not directory-eligible, they are official city entities)
-    is_mayoral_office = (
-        df_public.get(
-            "organization_type", pd.Series(["" for _ in range(len(df_public))])
-        )
-        .astype(str)
-        .str.strip()
-        .str.lower()
-        == "mayoral office"
-    )
+    is_mayoral_office = normalized("organization_type").eq("mayoral office")
 
-    df_public = df_public[
-        (
-            in_org_chart
-            | has_ops_name
-            | is_export_exception
-            | is_directory_eligible
-            | is_mayoral_office
-        )
-        & active_only
-    ].copy()
+    keep = (
+        in_org_chart
+        | has_ops_name
+        | is_export_exception
+        | is_directory_eligible
+        | is_mayoral_office
+    ) & active_only
 
-    if rows_before_filter != len(df_public):
+    if rows_before_filter != keep.sum():
         print(
-            f"Kept {len(df_public)} rows out of {rows_before_filter} after applying combined filter."
+            f"Kept {keep.sum()} rows out of {rows_before_filter} after applying combined filter."
         )
 
     # Select columns using canonical PUBLISHED_COLUMN_ORDER (excluding directory status added later)
@@ -918,13 +1016,11 @@ def main_with_dataframe(
         for c in PUBLISHED_COLUMN_ORDER
         if c in df_public.columns and c != "listed_in_nyc_gov_agency_directory"
     ]
-    df_selected = df_public[output_columns]
-    # No snake_case conversion needed - data is already in snake_case format
-    df_before_snake_case = df_selected.copy()
+    # Filter rows and project the published columns in one step
+    df_selected = df_public.loc[keep, output_columns]
 
     result = add_nycgov_directory_column(
         df_selected,
-        df_before_snake_case=df_before_snake_case if run_dir else None,
         df_previous_export=df_previous_export,
         run_id=run_id,
     )
@@ -937,19 +1033,14 @@ def main_with_dataframe(
         df_selected = result
 
     if "in_org_chart" in df_selected.columns:
-        normalized = (
-            df_selected["in_org_chart"]
-            .astype(str)
-            .str.strip()
-            .str.lower()
-            .replace({"": "false"})
+        # Anything other than "true" (blank, "false", unexpected) becomes "False"
+        is_true = (
+            df_selected["in_org_chart"].astype(str).str.strip().str.lower().eq("true")
         )
-        df_selected["in_org_chart"] = normalized.map(
-            {"true": "True", "false": "False"}
-        ).fillna("False")
+        df_selected["in_org_chart"] = is_true.map({True: "True", False: "False"})
 
     output_published.parent.mkdir(parents=True, exist_ok=True)
-    df_selected.to_csv(output_published, index=False, encoding="utf-8-sig")
+    write_csv(df_selected, output_published)
 
     return {
         "directory_changes": len(directory_changes),
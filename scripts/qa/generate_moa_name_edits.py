@@ -8,9 +8,15 @@ Name - MOA field for each entity with a valid nycgo_record_id.
 
 import csv
 import re
+from functools import cache
 from pathlib import Path
 
+import pandas as pd
 
+GOID_PATTERN = re.compile(r'NYC_GOID_(\d+)')
+
+
+@cache
 def convert_record_id(old_format: str) -> str:
     """Convert NYC_GOID_XXXXXX format to numeric format.
 
@@ -19,7 +25,7 @@ def convert_record_id(old_format: str) -> str:
     """
     if not old_format:
         return ""
-    match = re.match(r'NYC_GOID_(\d+)', old_format)
+    match = GOID_PATTERN.match(old_format)
     if match:
         numeric = int(match.group(1))
         # If it's already a 6-digit ID starting with 1, keep it as is
@@ -30,42 +36,62 @@ def convert_record_id(old_format: str) -> str:
     return old_format
 
 
+def convert_record_ids(record_ids: pd.Series) -> pd.Series:
+    """Vectorized convert_record_id over a Series of record IDs."""
+    digits = record_ids.str.extract(r'^NYC_GOID_(\d+)', expand=False)
+    matched = digits.notna()
+    numeric = digits[matched].astype('int64')
+    converted = numeric.where(numeric >= 100000, numeric + 100000).astype(str)
+    return record_ids.mask(matched, converted)
+
+
+def _read_columns(path: Path, columns: list) -> pd.DataFrame:
+    """Read only the given columns as strings.
+
+    Columns absent from the file read as ''.
+    """
+    df = pd.read_csv(
+        path,
+        usecols=lambda c: c in columns,
+        dtype=str,
+        keep_default_na=False,
+        encoding='utf-8-sig',
+    )
+    return df.reindex(columns=columns, fill_value='').fillna('')
+
+
 def load_golden_dataset(golden_path: Path) -> dict:
     """Load golden dataset and return dict of record_id -> name."""
+    df = _read_columns(golden_path, ['RecordID', 'Name'])
+    for col in df.columns:
+        df[col] = df[col].str.strip()
+    df = df[df['RecordID'].ne('')]
+    numeric_ids = convert_record_ids(df['RecordID'])
+
     golden = {}
-    with open(golden_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            record_id = row.get('RecordID', '').strip()
-            name = row.get('Name', '').strip()
-            if record_id:
-                # Store both old and new format
-                golden[record_id] = name
-                numeric_id = convert_record_id(record_id)
-                if numeric_id != record_id:
-                    golden[numeric_id] = name
+    rows = zip(df['RecordID'], numeric_ids, df['Name'], strict=True)
+    for record_id, numeric_id, name in rows:
+        # Store both old and new format
+        golden[record_id] = name
+        if numeric_id != record_id:
+            golden[numeric_id] = name
     return golden
 
 
 def load_crosswalk(crosswalk_path: Path) -> list:
     """Load MOA crosswalk and return list of mappings with valid record_ids."""
-    mappings = []
-    with open(crosswalk_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            moa_name = row.get('moa_entity_name', '').strip()
-            nycgo_record_id = row.get('nycgo_record_id', '').strip()
-            confidence = row.get('match_confidence', '').strip()
-
-            # Only include entities with valid mappings (not none/empty)
-            if moa_name and nycgo_record_id and confidence != 'none':
-                mappings.append({
-                    'moa_entity_name': moa_name,
-                    'nycgo_record_id': nycgo_record_id,
-                    'nycgo_name': row.get('nycgo_name', '').strip(),
-                    'match_confidence': confidence,
-                })
-    return mappings
+    columns = ['moa_entity_name', 'nycgo_record_id', 'nycgo_name', 'match_confidence']
+    df = _read_columns(crosswalk_path, columns)
+    for col in columns:
+        df[col] = df[col].str.strip()
+
+    # Only include entities with valid mappings (not none/empty)
+    valid = (
+        df['moa_entity_name'].ne('')
+        & df['nycgo_record_id'].ne('')
+        & df['match_confidence'].ne('none')
+    )
+    return df[valid].to_dict('records')
 
 
 def generate_edits(mappings: list, golden: dict, use_original_record_id: bool = True) -> list:
@@ -82,10 +108,11 @@ def generate_edits(mappings: list, golden: dict, use_original_record_id: bool =
     by_record_id = {}
     for mapping in mappings:
         old_record_id = mapping['nycgo_record_id']
+        numeric_record_id = convert_record_id(old_record_id)
         # Use original format (NYC_GOID_...) or convert to numeric
-        record_id_for_edit = old_record_id if use_original_record_id else convert_record_id(old_record_id)
+        record_id_for_edit = old_record_id if use_original_record_id else numeric_record_id
         moa_name = mapping['moa_entity_name']
-        nycgo_name = golden.get(old_record_id) or golden.get(convert_record_id(old_record_id)) or mapping['nycgo_name']
+        nycgo_name = golden.get(old_record_id) or golden.get(numeric_record_id) or mapping['nycgo_name']
 
         if record_id_for_edit not in by_record_id:
             by_record_id[record_id_for_edit] = {
@@ -130,8 +157,7 @@ def write_edits(edits: list, output_path: Path):
     with open(output_path, 'w', newline='', encoding='utf-8') as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
-        for edit in sorted(edits, key=sort_key):
-            writer.writerow(edit)
+        writer.writerows(sorted(edits, key=sort_key))
 
     print(f"Wrote {len(edits)} Name - MOA edits to {output_path}")
 
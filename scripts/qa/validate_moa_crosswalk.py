@@ -16,41 +16,67 @@ Output: CSV report with discrepancies and recommended corrections.
 
 import csv
 import re
+from functools import cache
 from pathlib import Path
 from collections import defaultdict
 
+import pandas as pd
 
+GOID_PATTERN = re.compile(r'NYC_GOID_(\d+)')
+
+
+@cache
 def convert_record_id(old_format: str) -> str:
     """Convert NYC_GOID_XXXXXX format to numeric format (100XXX)."""
     if not old_format:
         return ""
-    match = re.match(r'NYC_GOID_(\d+)', old_format)
+    match = GOID_PATTERN.match(old_format)
     if match:
         numeric = int(match.group(1))
         return f"100{numeric:03d}" if numeric < 1000 else str(100000 + numeric)
     return old_format
 
 
+def convert_record_ids(record_ids: pd.Series) -> pd.Series:
+    """Vectorized convert_record_id over a Series of record IDs."""
+    digits = record_ids.str.extract(r'^NYC_GOID_(\d+)', expand=False)
+    matched = digits.notna()
+    converted = (digits[matched].astype('int64') + 100000).astype(str)
+    return record_ids.mask(matched, converted)
+
+
+def _read_columns(path: Path, columns: list) -> pd.DataFrame:
+    """Read only the given columns as strings.
+
+    Columns absent from the file read as ''.
+    """
+    df = pd.read_csv(
+        path,
+        usecols=lambda c: c in columns,
+        dtype=str,
+        keep_default_na=False,
+        encoding='utf-8-sig',
+    )
+    return df.reindex(columns=columns, fill_value='').fillna('')
+
+
 def load_crosswalk(crosswalk_path: Path) -> dict:
     """Load MOA crosswalk and return dict keyed by moa_entity_name."""
-    crosswalk = {}
-    with open(crosswalk_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            moa_name = row.get('moa_entity_name', '').strip()
-            if moa_name:
-                crosswalk[moa_name] = {
-                    'moa_entity_name': moa_name,
-                    'moa_url': row.get('moa_url', ''),
-                    'moa_description': row.get('moa_description', ''),
-                    'nycgo_record_id': row.get('nycgo_record_id', ''),
-                    'nycgo_name': row.get('nycgo_name', ''),
-                    'similarity_score': row.get('similarity_score', ''),
-                    'match_confidence': row.get('match_confidence', ''),
-                    'needs_manual_review': row.get('needs_manual_review', ''),
-                    'notes': row.get('notes', ''),
-                }
-    return crosswalk
+    df = _read_columns(crosswalk_path, [
+        'moa_entity_name',
+        'moa_url',
+        'moa_description',
+        'nycgo_record_id',
+        'nycgo_name',
+        'similarity_score',
+        'match_confidence',
+        'needs_manual_review',
+        'notes',
+    ])
+    df['moa_entity_name'] = df['moa_entity_name'].str.strip()
+    df = df[df['moa_entity_name'].ne('')]
+    # Later rows for the same MOA name replace earlier ones
+    return {row['moa_entity_name']: row for row in df.to_dict('records')}
 
 
 def load_phase2_edits(edits_path: Path) -> tuple:
@@ -59,45 +85,35 @@ def load_phase2_edits(edits_path: Path) -> tuple:
     - new_entities: set of entity names being added as NEW
     - edited_entities: dict of record_id -> list of edits for existing entities
     """
-    new_entities = set()
-    edited_entities = defaultdict(list)
+    columns = ['record_id', 'record_name', 'field_name', 'action', 'justification']
+    df = _read_columns(edits_path, columns)
+    for col in columns:
+        df[col] = df[col].str.strip()
 
-    with open(edits_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            record_id = row.get('record_id', '').strip()
-            record_name = row.get('record_name', '').strip()
-            field_name = row.get('field_name', '').strip()
-            action = row.get('action', '').strip()
-            justification = row.get('justification', '').strip()
-
-            if record_id == 'NEW':
-                new_entities.add(record_name)
-            else:
-                edited_entities[record_id].append({
-                    'record_name': record_name,
-                    'field_name': field_name,
-                    'action': action,
-                    'justification': justification,
-                })
+    is_new = df['record_id'].eq('NEW')
+    new_entities = set(df.loc[is_new, 'record_name'])
+    edited_entities = defaultdict(list)
+    for row in df[~is_new].to_dict('records'):
+        edited_entities[row.pop('record_id')].append(row)
 
     return new_entities, edited_entities
 
 
 def load_golden_dataset(golden_path: Path) -> dict:
     """Load golden dataset and return dict of record_id -> name."""
+    df = _read_columns(golden_path, ['RecordID', 'Name'])
+    for col in df.columns:
+        df[col] = df[col].str.strip()
+    df = df[df['RecordID'].ne('')]
+    numeric_ids = convert_record_ids(df['RecordID'])
+
     golden = {}
-    with open(golden_path, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            record_id = row.get('RecordID', '').strip()
-            name = row.get('Name', '').strip()
-            if record_id:
-                # Store both old and new format
-                golden[record_id] = name
-                numeric_id = convert_record_id(record_id)
-                if numeric_id != record_id:
-                    golden[numeric_id] = name
+    rows = zip(df['RecordID'], numeric_ids, df['Name'], strict=True)
+    for record_id, numeric_id, name in rows:
+        # Store both old and new format
+        golden[record_id] = name
+        if numeric_id != record_id:
+            golden[numeric_id] = name
     return golden
 
 
@@ -110,6 +126,12 @@ def validate_crosswalk(crosswalk: dict, new_entities: set, edited_entities: dict
     # Track which record_ids have MOA mappings (for duplicate check)
     record_id_to_moa = defaultdict(list)
 
+    # Lowercase and tokenize each NEW entity name once, not once per MOA name
+    new_names = [
+        (new_name, new_name.lower(), _name_tokens(new_name))
+        for new_name in new_entities
+    ]
+
     for moa_name, mapping in crosswalk.items():
         crosswalk_record_id = mapping['nycgo_record_id']
         crosswalk_nycgo_name = mapping['nycgo_name']
@@ -121,11 +143,13 @@ def validate_crosswalk(crosswalk: dict, new_entities: set, edited_entities: dict
 
         # Check 1: NEW entity conflicts
         # MOA name matches a NEW entity being added, but crosswalk maps to something else
-        for new_name in new_entities:
+        moa_lower = moa_name.lower()
+        moa_tokens = _name_tokens(moa_name)
+        for new_name, new_lower, new_tokens in new_names:
             # Check if MOA name is similar to new entity name
-            if (moa_name.lower() in new_name.lower() or
-                new_name.lower() in moa_name.lower() or
-                _fuzzy_match(moa_name, new_name)):
+            if (moa_lower in new_lower or
+                new_lower in moa_lower or
+                _tokens_match(moa_tokens, new_tokens)):
 
                 if crosswalk_record_id:
                     discrepancies.append({
@@ -185,14 +209,23 @@ def validate_crosswalk(crosswalk: dict, new_entities: set, edited_entities: dict
     return discrepancies
 
 
-def _fuzzy_match(s1: str, s2: str) -> bool:
-    """Simple fuzzy match - check if strings share significant common words."""
-    words1 = set(s1.lower().replace('-', ' ').replace(',', ' ').split())
-    words2 = set(s2.lower().replace('-', ' ').replace(',', ' ').split())
-    # Remove common stop words
-    stop_words = {'the', 'of', 'and', 'a', 'an', 'for', 'to', 'in', 'on', 'at', 'by', 'nyc', 'new', 'york', 'city', 'board', 'commission', 'committee', 'department', 'office'}
-    words1 = words1 - stop_words
-    words2 = words2 - stop_words
+# Common words ignored by the fuzzy name match
+STOP_WORDS = frozenset({
+    'the', 'of', 'and', 'a', 'an', 'for', 'to', 'in', 'on', 'at', 'by',
+    'nyc', 'new', 'york', 'city', 'board', 'commission', 'committee', 'department', 'office',
+})
+
+# Hyphens and commas separate words like whitespace does
+WORD_SEPARATORS = str.maketrans('-,', '  ')
+
+
+def _name_tokens(name: str) -> set:
+    """Lowercased words of a name, without common stop words."""
+    return set(name.lower().translate(WORD_SEPARATORS).split()) - STOP_WORDS
+
+
+def _tokens_match(words1: set, words2: set) -> bool:
+    """Simple fuzzy match - check if tokenized names share significant common words."""
     # Check overlap
     if not words1 or not words2:
         return False
@@ -215,8 +248,9 @@ def write_report(discrepancies: list, output_path: Path):
     with open(output_path, 'w', newline='', encoding='utf-8') as f:
         writer = csv.DictWriter(f, fieldnames=fieldnames)
         writer.writeheader()
-        for row in sorted(discrepancies, key=lambda x: (x['conflict_type'], x['moa_entity_name'])):
-            writer.writerow(row)
+        writer.writerows(
+            sorted(discrepancies, key=lambda x: (x['conflict_type'], x['moa_entity_name']))
+        )
 
     print(f"Wrote {len(discrepancies)} discrepancies to {output_path}")
 
@@ -30,32 +30,50 @@ PROJECT_ROOT = Path(__file__).resolve().parents[2]
 INPUT_FILE = PROJECT_ROOT / "data" / "working" / "NYCGO_golden_dataset_v2.0.0-dev.csv"
 OUTPUT_FILE = PROJECT_ROOT / "data" / "analysis" / "phase_ii_validation_report.csv"
 
+# Only these columns are read from the input
+INPUT_COLUMNS = [
+    "RecordID",
+    "Name",
+    "authorizing_authority",
+    "authorizing_url",
+    "org_chart_oversight",
+    "appointments_summary",
+]
+
 # Targets
 AUTHORIZING_AUTHORITY_TARGET = 1.00  # 100%
 AUTHORIZING_URL_TARGET = 0.90  # 90%
 ORG_CHART_OVERSIGHT_TARGET = 0.80  # 80%
 
 
+def issue_records(rows: pd.DataFrame, field: str, issue, severity: str) -> list:
+    """Build issue dicts for the given rows in one pass.
+
+    ``issue`` may be a single string or a Series aligned with ``rows``.
+    """
+    return (
+        rows[["RecordID", "Name"]]
+        .rename(columns={"RecordID": "record_id", "Name": "name"})
+        .assign(field=field, issue=issue, severity=severity)
+        .to_dict("records")
+    )
+
+
+def populated_mask(values: pd.Series) -> pd.Series:
+    """Return True where a field holds a non-blank value."""
+    return values.notna() & (values.str.strip() != "")
+
+
 def validate_authorizing_authority(df: pd.DataFrame) -> dict:
     """Validate authorizing_authority field."""
     total = len(df)
-    populated = df["authorizing_authority"].notna() & (
-        df["authorizing_authority"].str.strip() != ""
-    )
+    populated = populated_mask(df["authorizing_authority"])
     count_populated = populated.sum()
     percentage = count_populated / total if total > 0 else 0
 
-    issues = []
-    for _idx, row in df[~populated].iterrows():
-        issues.append(
-            {
-                "record_id": row["RecordID"],
-                "name": row["Name"],
-                "field": "authorizing_authority",
-                "issue": "missing",
-                "severity": "critical",
-            }
-        )
+    issues = issue_records(
+        df[~populated], "authorizing_authority", "missing", "critical"
+    )
 
     return {
         "field": "authorizing_authority",
@@ -103,43 +121,46 @@ def validate_url(url: str) -> tuple:
 def validate_authorizing_url(df: pd.DataFrame) -> dict:
     """Validate authorizing_url field."""
     total = len(df)
-    populated = df["authorizing_url"].notna() & (
-        df["authorizing_url"].str.strip() != ""
-    )
+    populated = populated_mask(df["authorizing_url"])
     count_populated = populated.sum()
     percentage = count_populated / total if total > 0 else 0
 
     issues = []
 
     # Check missing URLs
-    for _idx, row in df[~populated].iterrows():
-        issues.append(
-            {
-                "record_id": row["RecordID"],
-                "name": row["Name"],
-                "field": "authorizing_url",
-                "issue": "missing",
-                "severity": "high" if percentage < AUTHORIZING_URL_TARGET else "medium",
-            }
+    issues.extend(
+        issue_records(
+            df[~populated],
+            "authorizing_url",
+            "missing",
+            "high" if percentage < AUTHORIZING_URL_TARGET else "medium",
         )
+    )
 
     # Validate URL format for populated URLs
-    for _idx, row in df[populated].iterrows():
-        url = row["authorizing_url"]
-        # Handle pipe-separated multiple URLs
-        urls = [u.strip() for u in url.split("|") if u.strip()]
-        for u in urls:
-            is_valid, is_accessible, error = validate_url(u)
-            if not is_valid:
-                issues.append(
-                    {
-                        "record_id": row["RecordID"],
-                        "name": row["Name"],
-                        "field": "authorizing_url",
-                        "issue": f"invalid_format: {error}",
-                        "severity": "high",
-                    }
-                )
+    # Handle pipe-separated multiple URLs: one row per URL, in original order
+    urls = (
+        df.loc[populated, ["RecordID", "Name"]]
+        .assign(url=df.loc[populated, "authorizing_url"].str.split("|"))
+        .explode("url", ignore_index=True)
+    )
+    urls["url"] = urls["url"].str.strip()
+    urls = urls[urls["url"].ne("")]
+    # Each distinct URL is checked once; keep messages for invalid ones only
+    errors = {}
+    for url in set(urls["url"]):
+        is_valid, _is_accessible, error = validate_url(url)
+        if not is_valid:
+            errors[url] = f"invalid_format: {error}"
+    invalid = urls["url"].isin(errors)
+    issues.extend(
+        issue_records(
+            urls[invalid],
+            "authorizing_url",
+            urls.loc[invalid, "url"].map(errors),
+            "high",
+        )
+    )
 
     return {
         "field": "authorizing_url",
@@ -155,9 +176,7 @@ def validate_authorizing_url(df: pd.DataFrame) -> dict:
 def validate_org_chart_oversight(df: pd.DataFrame) -> dict:
     """Validate org_chart_oversight field."""
     total = len(df)
-    populated = df["org_chart_oversight"].notna() & (
-        df["org_chart_oversight"].str.strip() != ""
-    )
+    populated = populated_mask(df["org_chart_oversight"])
     count_populated = populated.sum()
     percentage = count_populated / total if total > 0 else 0
 
@@ -167,32 +186,29 @@ def validate_org_chart_oversight(df: pd.DataFrame) -> dict:
     issues = []
 
     # Check missing values
-    for _idx, row in df[~populated].iterrows():
-        issues.append(
-            {
-                "record_id": row["RecordID"],
-                "name": row["Name"],
-                "field": "org_chart_oversight",
-                "issue": "missing",
-                "severity": (
-                    "medium" if percentage < ORG_CHART_OVERSIGHT_TARGET else "low"
-                ),
-            }
+    issues.extend(
+        issue_records(
+            df[~populated],
+            "org_chart_oversight",
+            "missing",
+            "medium" if percentage < ORG_CHART_OVERSIGHT_TARGET else "low",
         )
+    )
 
     # Validate RecordID references
-    for _idx, row in df[populated].iterrows():
-        oversight_id = row["org_chart_oversight"].strip()
-        if oversight_id and oversight_id not in valid_record_ids:
-            issues.append(
-                {
-                    "record_id": row["RecordID"],
-                    "name": row["Name"],
-                    "field": "org_chart_oversight",
-                    "issue": f"invalid_record_id: {oversight_id} not found in dataset",
-                    "severity": "high",
-                }
-            )
+    rows = df[populated]
+    oversight_ids = rows["org_chart_oversight"].str.strip()
+    unknown = oversight_ids.ne("") & ~oversight_ids.isin(valid_record_ids)
+    issues.extend(
+        issue_records(
+            rows[unknown],
+            "org_chart_oversight",
+            oversight_ids[unknown].map(
+                "invalid_record_id: {} not found in dataset".format
+            ),
+            "high",
+        )
+    )
 
     return {
         "field": "org_chart_oversight",
@@ -212,27 +228,24 @@ def validate_appointments_summary(
     # If we have MOA crosswalk, we can identify which entities should have this
     # For now, just check population percentage
     total = len(df)
-    populated = df["appointments_summary"].notna() & (
-        df["appointments_summary"].str.strip() != ""
-    )
+    populated = populated_mask(df["appointments_summary"])
     count_populated = populated.sum()
     percentage = count_populated / total if total > 0 else 0
 
     issues = []
 
     # Check for very short summaries (likely incomplete)
-    for _idx, row in df[populated].iterrows():
-        summary = row["appointments_summary"]
-        if len(summary.strip()) < 20:  # Arbitrary threshold
-            issues.append(
-                {
-                    "record_id": row["RecordID"],
-                    "name": row["Name"],
-                    "field": "appointments_summary",
-                    "issue": f'summary_too_short: "{summary[:50]}"',
-                    "severity": "low",
-                }
-            )
+    rows = df[populated]
+    summaries = rows["appointments_summary"]
+    too_short = summaries.str.strip().str.len() < 20  # Arbitrary threshold
+    issues.extend(
+        issue_records(
+            rows[too_short],
+            "appointments_summary",
+            summaries[too_short].str[:50].map('summary_too_short: "{}"'.format),
+            "low",
+        )
+    )
 
     return {
         "field": "appointments_summary",
@@ -316,10 +329,12 @@ def save_issues_report(results: list, output_file: Path):
     issues_df = pd.DataFrame(all_issues)
 
     # Sort by severity then field
-    severity_order = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-    issues_df["_severity_order"] = issues_df["severity"].map(severity_order)
-    issues_df = issues_df.sort_values(["_severity_order", "field", "name"])
-    issues_df = issues_df.drop("_severity_order", axis=1)
+    issues_df["severity"] = pd.Categorical(
+        issues_df["severity"],
+        categories=["critical", "high", "medium", "low"],
+        ordered=True,
+    )
+    issues_df = issues_df.sort_values(["severity", "field", "name"])
 
     output_file.parent.mkdir(parents=True, exist_ok=True)
     issues_df.to_csv(output_file, index=False, encoding="utf-8-sig")
@@ -339,7 +354,7 @@ def main():
 
     # Load data
     print(f"\nLoading data from: {INPUT_FILE}")
-    df = pd.read_csv(INPUT_FILE, dtype=str).fillna("")
+    df = pd.read_csv(INPUT_FILE, dtype=str, usecols=INPUT_COLUMNS).fillna("")
     print(f"✅ Loaded {len(df)} entities")
 
     # Run validations
@@ -51,20 +51,9 @@ FIELD_MAP = {
 }
 
 
-def normalize_record(row: pd.Series) -> dict:
-    """Convert a DataFrame row to a dict with normalized field names for rules."""
-    record = {}
-    for csv_col, rule_field in FIELD_MAP.items():
-        if csv_col in row.index:
-            record[rule_field] = row[csv_col]
-    return record
-
-
-def normalize_bool(value: str) -> str:
-    """Normalize boolean values for comparison."""
-    if str(value).strip().lower() in ("true", "1", "t", "yes"):
-        return "True"
-    return "False"
+def normalize_bool(values: pd.Series) -> pd.Series:
+    """Normalize boolean values for comparison (True where a value reads as true)."""
+    return values.astype(str).str.strip().str.lower().isin(("true", "1", "t", "yes"))
 
 
 def create_baseline() -> None:
@@ -105,18 +94,31 @@ def run_regression_test(verbose: bool = False) -> None:  # noqa: C901
 
     print(f"Loading baseline from {BASELINE_PATH}")
     baseline = pd.read_csv(BASELINE_PATH, dtype=str).fillna("")
-    baseline_dict = {row["record_id"]: row for _, row in baseline.iterrows()}
+    # record_id -> (raw baseline value, normalized boolean)
+    listed = baseline["listed_in_nyc_gov_agency_directory"]
+    baseline_lookup = dict(
+        zip(
+            baseline["record_id"],
+            zip(listed, normalize_bool(listed), strict=True),
+            strict=True,
+        )
+    )
 
     print(f"Loading published dataset from {PUBLISHED_PATH}")
-    published = pd.read_csv(PUBLISHED_PATH, dtype=str).fillna("")
+    published = pd.read_csv(
+        PUBLISHED_PATH, dtype=str, usecols=lambda col: col in FIELD_MAP
+    ).fillna("")
 
     print(f"Evaluating {len(published)} records with new rules...")
 
     differences = []
     missing_in_baseline = []
 
-    for _, row in published.iterrows():
-        record = normalize_record(row)
+    # Rename to the rule field names once, then build plain dicts per row
+    records = published.rename(columns=FIELD_MAP)
+    fields = list(records.columns)
+    for row in records.itertuples(index=False, name=None):
+        record = dict(zip(fields, row, strict=True))
         record_id = record.get("record_id", "")
 
         # Evaluate with new rules
@@ -124,14 +126,14 @@ def run_regression_test(verbose: bool = False) -> None:  # noqa: C901
         new_value = "True" if result.eligible else "False"
 
         # Get baseline value
-        if record_id not in baseline_dict:
+        baseline_entry = baseline_lookup.get(record_id)
+        if baseline_entry is None:
             missing_in_baseline.append(record_id)
             continue
 
-        old_value = baseline_dict[record_id]["listed_in_nyc_gov_agency_directory"]
-        old_normalized = normalize_bool(old_value)
+        old_value, was_listed = baseline_entry
 
-        if new_value != old_normalized:
+        if result.eligible != was_listed:
             differences.append(
                 {
                     "record_id": record_id,
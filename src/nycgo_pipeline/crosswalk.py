@@ -23,59 +23,164 @@ DEFAULT_SOURCE_CONFIG: dict[str, SourceConfig] = {
 }
 
 
+_RECORD_ID_COLUMNS = ("record_id", "recordid")
+
+
+def _golden_read_options(sources: dict[str, SourceConfig] | None) -> dict:
+    """Return ``read_csv`` options that load only the columns a crosswalk uses."""
+
+    wanted = {
+        config.golden_column.lower()
+        for config in (sources or DEFAULT_SOURCE_CONFIG).values()
+    }
+    wanted.update(_RECORD_ID_COLUMNS)
+    return {
+        "dtype": str,
+        "na_filter": False,
+        "usecols": lambda col: col.lower() in wanted,
+    }
+
+
+def find_record_id_column(columns) -> str | None:
+    """Return the record id column in ``columns`` (case-insensitive), if any."""
+
+    col_index = {str(col).lower(): col for col in columns}
+    return next(
+        (col_index[name] for name in _RECORD_ID_COLUMNS if name in col_index), None
+    )
+
+
+def read_golden_csv(
+    input_path: Path,
+    *,
+    sources: dict[str, SourceConfig] | None = None,
+    nrows: int | None = None,
+) -> pd.DataFrame:
+    """Read the record id and source-name columns of the golden dataset.
+
+    Columns not referenced by ``sources`` are skipped at parse time. Source
+    names are free text, so NA inference is skipped as well: blank cells come
+    back as ``""`` and the parser avoids checking every cell against the NA
+    sentinel list. ``nrows=0`` reads just the header.
+    """
+
+    return pd.read_csv(input_path, nrows=nrows, **_golden_read_options(sources))
+
+
 def build_crosswalk(
     df: pd.DataFrame,
     *,
     sources: dict[str, SourceConfig] | None = None,
     record_id_column: str | None = None,
+    dedup: bool = False,
 ) -> pd.DataFrame:
-    """Return a long-format crosswalk DataFrame for the provided dataset."""
+    """Return a long-format crosswalk DataFrame for the provided dataset.
+
+    With ``dedup`` repeated ``(record_id, source_system, source_name)`` rows,
+    e.g. from duplicated golden records, are collapsed to their first
+    occurrence.
+    """
 
     sources = sources or DEFAULT_SOURCE_CONFIG
+    col_index = {str(col).lower(): col for col in df.columns}
     if record_id_column is None:
-        try:
-            record_id_column = next(
-                col for col in df.columns if col.lower() in ("record_id", "recordid")
-            )
-        except StopIteration as exc:  # pragma: no cover - defensive
-            raise ValueError("record_id column not found in dataframe") from exc
-
-    frames: list[pd.DataFrame] = []
-    for system_name, config in sources.items():
-        if config.golden_column not in df.columns:
-            continue
-
-        subset = (
-            df[[record_id_column, config.golden_column]]
-            .copy()
-            .rename(columns={config.golden_column: "source_name"})
-        )
-        subset.dropna(subset=["source_name"], inplace=True)
-        subset = subset[subset["source_name"].str.strip() != ""]
-        if subset.empty:
-            continue
-
-        subset["source_system"] = system_name
-        subset["source_column"] = config.source_column
-        frames.append(subset)
-
-    if not frames:
+        record_id_column = find_record_id_column(df.columns)
+        if record_id_column is None:  # pragma: no cover - defensive
+            raise ValueError("record_id column not found in dataframe")
+
+    # Source columns are matched case-insensitively so casing drift between
+    # dataset versions does not silently drop a source system.
+    golden_columns = {
+        system_name: col_index[config.golden_column.lower()]
+        for system_name, config in sources.items()
+        if config.golden_column.lower() in col_index
+    }
+    present = {system_name: sources[system_name] for system_name in golden_columns}
+    if not present:
         return pd.DataFrame(
             columns=["record_id", "source_system", "source_column", "source_name"]
         )
 
-    df_long = pd.concat(frames, ignore_index=True)
-    df_long.rename(columns={record_id_column: "record_id"}, inplace=True)
-    return df_long[["record_id", "source_system", "source_column", "source_name"]]
+    # Lay the source columns end to end (source-major, row order within each
+    # source) and build the long frame straight from the surviving array
+    # positions, so record ids are gathered once instead of being copied by a
+    # column selection, a melt and every subsequent filter.
+    stride = max(len(df), 1)
+    names = pd.Series(
+        df[list(golden_columns.values())].to_numpy(dtype=object).ravel(order="F")
+    )
+    # One regex scan drops empty and whitespace-only strings; for str patterns
+    # \S is exactly "not str.isspace()", so this matches strip() != "".
+    # Non-str values get na=True and are kept, as they always were.
+    names = names[names.notna() & names.str.contains(r"\S", regex=True, na=True)]
+    positions = names.index.to_numpy()
+
+    # A handful of systems repeat across every row, so store them as
+    # categoricals (small integer codes) rather than one string per row.
+    source_system = pd.Series(
+        pd.Categorical.from_codes(positions // stride, categories=list(present))
+    )
+    source_column = source_system.map(
+        {name: config.source_column for name, config in present.items()}
+    )
+    df_long = pd.DataFrame(
+        {
+            "record_id": df[record_id_column].to_numpy()[positions % stride],
+            "source_system": source_system,
+            "source_column": source_column,
+            "source_name": names.to_numpy(),
+        }
+    )
+    if dedup:
+        df_long = df_long.drop_duplicates(
+            subset=["record_id", "source_system", "source_name"], ignore_index=True
+        )
+    return df_long
 
 
-def generate_crosswalk(input_path: Path, output_path: Path) -> Path:
-    """Read the input CSV and write the crosswalk to ``output_path``."""
+def generate_crosswalk(
+    input_path: Path,
+    output_path: Path,
+    *,
+    sources: dict[str, SourceConfig] | None = None,
+    chunksize: int | None = None,
+) -> Path:
+    """Read the input CSV and write the crosswalk to ``output_path``.
+
+    With ``chunksize`` the golden file is streamed in batches of that many rows
+    and each batch's crosswalk rows are appended as soon as they are built, so
+    peak memory is bounded by one batch. Output rows are then grouped by batch
+    rather than by source system.
+    """
 
-    df = pd.read_csv(input_path, dtype=str)
-    crosswalk_df = build_crosswalk(df)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    crosswalk_df.to_csv(output_path, index=False, encoding="utf-8-sig")
+    if chunksize is None:
+        crosswalk_df = build_crosswalk(
+            read_golden_csv(input_path, sources=sources), sources=sources
+        )
+        crosswalk_df.to_csv(output_path, index=False, encoding="utf-8-sig")
+        return output_path
+
+    # Check the header before the output file is created, so a bad input does
+    # not leave an empty crosswalk behind.
+    header_columns = read_golden_csv(input_path, sources=sources, nrows=0).columns
+    if find_record_id_column(header_columns) is None:
+        raise ValueError("Could not find a 'RecordID' column in the input file.")
+
+    reader = pd.read_csv(
+        input_path, chunksize=chunksize, **_golden_read_options(sources)
+    )
+    with output_path.open("w", newline="", encoding="utf-8-sig") as handle:
+        header = True
+        for chunk in reader:
+            build_crosswalk(chunk, sources=sources).to_csv(
+                handle, index=False, header=header
+            )
+            header = False
+        if header:  # no data rows; still emit the header
+            build_crosswalk(pd.DataFrame(columns=["record_id"])).to_csv(
+                handle, index=False
+            )
     return output_path
 
 
@@ -83,5 +188,7 @@ __all__ = [
     "SourceConfig",
     "DEFAULT_SOURCE_CONFIG",
     "build_crosswalk",
+    "find_record_id_column",
     "generate_crosswalk",
+    "read_golden_csv",
 ]
@@ -83,6 +83,17 @@ STATE_GOVERNMENT_EXEMPTIONS = [
     "Richmond County Public Administrator",
 ]
 
+# Frozen views of the lists above for O(1) membership tests. The lists stay
+# the editable, ordered source; rules and vectorized exports use these.
+NONPROFIT_EXEMPTION_SET = frozenset(NONPROFIT_EXEMPTIONS)
+ADVISORY_EXEMPTION_SET = frozenset(ADVISORY_EXEMPTIONS)
+MANUAL_OVERRIDE_TRUE_SET = frozenset(MANUAL_OVERRIDE_TRUE)
+MANUAL_OVERRIDE_FALSE_SET = frozenset(MANUAL_OVERRIDE_FALSE)
+PENSION_FUND_ALLOWLIST_SET = frozenset(PENSION_FUND_ALLOWLIST)
+PUBLISHED_EXPORT_EXCEPTION_IDS = frozenset(
+    record_id for record_id, _name in PUBLISHED_EXPORT_EXCEPTIONS
+)
+
 
 # =============================================================================
 # HELPER FUNCTIONS
@@ -172,7 +183,7 @@ TYPE_SPECIFIC_RULES = [
         description="Pension Fund: included if on allowlist (city employee funds)",
         check=lambda r: (
             r.get("organization_type") == "Pension Fund"
-            and r.get("name") in PENSION_FUND_ALLOWLIST
+            and r.get("name") in PENSION_FUND_ALLOWLIST_SET
         ),
         category="type_specific",
         details_on_match=lambda r: f"Allowlist: {r.get('name')}",
@@ -210,13 +221,13 @@ TYPE_SPECIFIC_RULES = [
             r.get("organization_type") == "Nonprofit Organization"
             and (
                 _is_truthy(r.get("in_org_chart", ""))
-                or r.get("name") in NONPROFIT_EXEMPTIONS
+                or r.get("name") in NONPROFIT_EXEMPTION_SET
             )
         ),
         category="type_specific",
         details_on_match=lambda r: (
             f"Exemption: {r.get('name')}"
-            if r.get("name") in NONPROFIT_EXEMPTIONS
+            if r.get("name") in NONPROFIT_EXEMPTION_SET
             else "In Org Chart"
         ),
     ),
@@ -228,13 +239,13 @@ TYPE_SPECIFIC_RULES = [
             and (
                 _is_truthy(r.get("in_org_chart", ""))
                 or has_main_nyc_gov_url(str(r.get("url", "")))
-                or r.get("name") in ADVISORY_EXEMPTIONS
+                or r.get("name") in ADVISORY_EXEMPTION_SET
             )
         ),
         category="type_specific",
         details_on_match=lambda r: (
             f"Exemption: {r.get('name')}"
-            if r.get("name") in ADVISORY_EXEMPTIONS
+            if r.get("name") in ADVISORY_EXEMPTION_SET
             else (
                 "Has main nyc.gov URL"
                 if has_main_nyc_gov_url(str(r.get("url", "")))
@@ -281,14 +292,14 @@ def evaluate_eligibility(record: dict) -> EligibilityResult:
 
     # Check manual overrides first
     record_id = record.get("record_id", "")
-    if record_id in MANUAL_OVERRIDE_TRUE:
+    if record_id in MANUAL_OVERRIDE_TRUE_SET:
         return EligibilityResult(
             eligible=True,
             reasoning="Manual override: forced TRUE",
             reasoning_detailed="Manual override: forced TRUE",
             rule_results=[],
         )
-    if record_id in MANUAL_OVERRIDE_FALSE:
+    if record_id in MANUAL_OVERRIDE_FALSE_SET:
         return EligibilityResult(
             eligible=False,
             reasoning="Manual override: forced FALSE",
@@ -176,10 +176,20 @@ def append_run_changelog(
     return len(converted)
 
 
+# DEFLATE level 1 is ~3x faster than the default (6) on the CSV-heavy run
+# folder at a small cost in archive size.
+ARCHIVE_COMPRESSLEVEL = 1
+
+
 def make_zip(run_dir: Path, dist_dir: Path, run_id: str) -> Path:
     dist_dir.mkdir(parents=True, exist_ok=True)
     zip_path = dist_dir / f"nycgo-run-{run_id}.zip"
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(
+        zip_path,
+        "w",
+        zipfile.ZIP_DEFLATED,
+        compresslevel=ARCHIVE_COMPRESSLEVEL,
+    ) as zf:
         for path in run_dir.rglob("*"):
             zf.write(path, path.relative_to(run_dir))
     return zip_path
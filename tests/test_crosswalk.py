@@ -0,0 +1,150 @@
+"""Tests for building the long-format source name crosswalk."""
+
+import numpy as np
+import pandas as pd
+
+from nycgo_pipeline.crosswalk import (
+    DEFAULT_SOURCE_CONFIG,
+    SourceConfig,
+    build_crosswalk,
+    generate_crosswalk,
+)
+
+CROSSWALK_COLUMNS = ["record_id", "source_system", "source_column", "source_name"]
+
+
+def _concat_crosswalk(df, sources=DEFAULT_SOURCE_CONFIG):
+    """Reference per-source concat the crosswalk used to be built with."""
+    frames = []
+    for system_name, config in sources.items():
+        if config.golden_column not in df.columns:
+            continue
+        subset = df[["record_id", config.golden_column]].rename(
+            columns={config.golden_column: "source_name"}
+        )
+        subset = subset.dropna(subset=["source_name"])
+        subset = subset[subset["source_name"].str.strip() != ""]
+        frames.append(
+            subset.assign(source_system=system_name, source_column=config.source_column)
+        )
+    return pd.concat(frames, ignore_index=True)[CROSSWALK_COLUMNS]
+
+
+def _as_plain(df):
+    """Drop categorical dtypes so frames compare on values only."""
+    return df.astype(object)
+
+
+def _golden_frame():
+    return pd.DataFrame(
+        {
+            "record_id": ["100001", "100002", "100003", "100004"],
+            "name": ["A", "B", "C", "D"],
+            "name_ops": ["Ops A", "", "Ops C", "Ops D"],
+            "name_cpo": ["CPO A", "CPO B", None, "CPO D"],
+            "name_greenbook": [np.nan, "GB B", "GB C", "  "],
+        }
+    )
+
+
+def test_build_crosswalk_matches_concat_order():
+    """Rows come out source-major, in row order within each source."""
+    df = _golden_frame()
+
+    result = build_crosswalk(df)
+
+    assert list(result.columns) == CROSSWALK_COLUMNS
+    pd.testing.assert_frame_equal(_as_plain(result), _as_plain(_concat_crosswalk(df)))
+    assert list(result["source_system"]) == [
+        "Ops",
+        "Ops",
+        "Ops",
+        "CPO",
+        "CPO",
+        "CPO",
+        "Greenbook",
+        "Greenbook",
+    ]
+
+
+def test_build_crosswalk_drops_blank_names():
+    """NaN, empty and whitespace-only names are dropped."""
+    df = pd.DataFrame(
+        {
+            "record_id": ["1", "2", "3", "4", "5"],
+            "name_ops": [np.nan, None, "", " \t ", " Kept "],
+        }
+    )
+
+    result = build_crosswalk(df)
+
+    assert list(result["record_id"]) == ["5"]
+    assert list(result["source_name"]) == [" Kept "]
+
+
+def test_build_crosswalk_keeps_non_string_names():
+    """Non-str values are kept, as the per-source concat kept them."""
+    df = pd.DataFrame({"record_id": ["1", "2"], "name_ops": [42, "Ops"]})
+
+    result = build_crosswalk(df)
+
+    assert list(result["source_name"]) == [42, "Ops"]
+    pd.testing.assert_frame_equal(_as_plain(result), _as_plain(_concat_crosswalk(df)))
+
+
+def test_build_crosswalk_skips_absent_source_columns():
+    """Configured sources without a golden column are skipped."""
+    df = _golden_frame().drop(columns=["name_cpo"])
+
+    result = build_crosswalk(df)
+
+    assert set(result["source_system"]) == {"Ops", "Greenbook"}
+    pd.testing.assert_frame_equal(_as_plain(result), _as_plain(_concat_crosswalk(df)))
+
+    only_missing = {"Missing": SourceConfig("name_missing", "Name - Missing")}
+    empty = build_crosswalk(df, sources=only_missing)
+    assert empty.empty
+    assert list(empty.columns) == CROSSWALK_COLUMNS
+
+
+def test_build_crosswalk_zero_rows():
+    """A frame without rows yields an empty crosswalk with the full schema."""
+    df = _golden_frame().iloc[:0]
+
+    result = build_crosswalk(df)
+
+    assert result.empty
+    assert list(result.columns) == CROSSWALK_COLUMNS
+
+
+def test_build_crosswalk_dedup():
+    """dedup keeps the first of repeated (record_id, system, name) rows."""
+    df = pd.DataFrame(
+        {
+            "record_id": ["1", "1", "2", "1"],
+            "name_ops": ["Ops", "Ops", "Ops", "Other"],
+        }
+    )
+
+    assert len(build_crosswalk(df)) == 4
+    result = build_crosswalk(df, dedup=True)
+
+    assert list(result["record_id"]) == ["1", "2", "1"]
+    assert list(result["source_name"]) == ["Ops", "Ops", "Other"]
+    assert list(result.index) == [0, 1, 2]
+
+
+def test_generate_crosswalk_chunked_matches_unbatched(tmp_path):
+    """Streaming in batches produces the same rows, grouped by batch."""
+    input_path = tmp_path / "golden.csv"
+    _golden_frame().to_csv(input_path, index=False)
+
+    whole = generate_crosswalk(input_path, tmp_path / "whole.csv")
+    chunked = generate_crosswalk(input_path, tmp_path / "chunked.csv", chunksize=3)
+
+    def read_rows(path):
+        df = pd.read_csv(path, dtype=str, keep_default_na=False, encoding="utf-8-sig")
+        return sorted(df.itertuples(index=False, name=None))
+
+    assert read_rows(whole) == read_rows(chunked)
+    assert len(read_rows(whole)) == 8
@@ -2,6 +2,7 @@
 """
 Test export_dataset.py changelog tracking of directory field changes.
 """
+
 import csv
 
 # Import the functions we need to test
@@ -13,8 +14,11 @@ import pandas as pd
 import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
+from nycgo_pipeline.directory_rules import evaluate_eligibility
 from scripts.process.export_dataset import (
     add_nycgov_directory_column,
+    directory_eligibility_mask,
+    to_snake_case,
     write_proposed_changes,
 )
 
@@ -55,7 +59,6 @@ def test_directory_column_change_tracking():
     # Run the function with tracking enabled
     df_result, changes = add_nycgov_directory_column(
         df_current,
-        df_before_snake_case=df_before,
         df_previous_export=df_before,
         run_id="test_run_123",
     )
@@ -195,7 +198,6 @@ def test_no_changes_when_values_unchanged():
 
     df_result, changes = add_nycgov_directory_column(
         df_current,
-        df_before_snake_case=df_before,
         df_previous_export=df_before,
         run_id="test_run_789",
     )
@@ -204,5 +206,29 @@ def test_no_changes_when_values_unchanged():
     assert len(changes) == 0, "Should not detect changes when values are unchanged"
 
 
+def test_directory_eligibility_mask_matches_rules():
+    """The vectorized mask must agree with evaluate_eligibility row by row."""
+    golden = Path(__file__).parent.parent / (
+        "data/published/latest/NYCGO_golden_dataset_latest.csv"
+    )
+    df_golden = pd.read_csv(golden, dtype=str, keep_default_na=False)
+    df_golden.columns = [to_snake_case(c) for c in df_golden.columns]
+
+    df_edge = pd.DataFrame(
+        {
+            "record_id": ["NYC_GOID_000001", "NYC_GOID_000002", None],
+            "name": ["A", "B", None],
+            "operational_status": [" active ", "Active", float("nan")],
+            "organization_type": ["Division", "Mayoral Agency", None],
+            "url": ["https://x.ny.gov/y.nyc.gov", "", float("nan")],
+            "in_org_chart": [" TRUE ", True, float("nan")],
+        }
+    )
+
+    for df in (df_golden, df_edge):
+        expected = [evaluate_eligibility(r).eligible for r in df.to_dict("records")]
+        assert directory_eligibility_mask(df).tolist() == expected
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])